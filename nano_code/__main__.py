@@ -10,13 +10,32 @@ from .llm import llm_complete
 from .agent_tool.tools import OS_TOOLS
 from .utils.logger import AIConsoleLogger
 
+SYSTEM_PROMPT = """You are a helpful assistant that can help with tasks using tools.
+Your current working directory is {working_dir}.
+
+There are few rules:
+- Always use absolute path.
+- Line number is 1-based.
+- When writing the code of my requirements, you can stop and ask me for more details if you need.
+- Always examine if you have accomplished the tasks before you stop, if not, continue to try. If yes, report to me with your recap.
+- Always tell me your brief plan before you call tools, but don't wait for my approval unless you're required to do so in some specific cases.
+- When your plan failed, try to fix it by yourself instead of stopping trying.
+- The files you read before maybe updated, make sure you read the latest version before you edit them.
+{memories}
+"""
+
 
 async def agent_loop(session: Session, CONSOLE: Console):
     code_memories = session.get_memory()
     memories = (
         f"""Below are some working memories:
 {code_memories}"""
-        or ""
+        if code_memories
+        else ""
+    )
+    # Working dir and memories are fixed for the session, format the prompt once
+    system_prompt = SYSTEM_PROMPT.format(
+        working_dir=session.working_dir, memories=memories
     )
     messages = []
     wait_user = True
@@ -36,19 +55,7 @@ async def agent_loop(session: Session, CONSOLE: Console):
             session,
             session.working_env.llm_main_model,
             messages,
-            system_prompt=f"""You are a helpful assistant that can help with tasks using tools.
-Your current working directory is {session.working_dir}.
-
-There are few rules:
-- Always use absolute path.
-- Line number is 1-based.
-- When writing the code of my requirements, you can stop and ask me for more details if you need.
-- Always examine if you have accomplished the tasks before you stop, if not, continue to try. If yes, report to me with your recap.
-- Always tell me your brief plan before you call tools, but don't wait for my approval unless you're required to do so in some specific cases.
-- When your plan failed, try to fix it by yourself instead of stopping trying.
-- The files you read before maybe updated, make sure you read the latest version before you edit them.
-{memories}
-""",
+            system_prompt=system_prompt,
             tools=OS_TOOLS.get_schemas(),
         )
         response = r.choices[0]
@@ -68,9 +68,10 @@ class AgentToolDefine(BaseModel, ABC):
             if v is not None:
                 return v
 
-            start_time = asyncio.get_event_loop().time()
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
             r = await self._execute(session, arguments)
-            finish_time = asyncio.get_event_loop().time()
+            finish_time = loop.time()
 
             r.for_llm = truncate_text(r.for_llm, MAX_FOR_LLM_TOOL_RETURN_TOKENS)
             session.update_tool_checkpoint(
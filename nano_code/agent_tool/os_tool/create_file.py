@@ -1,8 +1,6 @@
 import os
-from ...constants import MAX_READ_FILE_LINES, MAX_LINE_CHAR_LENGTH
 from ..base import AgentToolDefine, AgentToolReturn
 from ...core.session import Session
-from ...utils.file import is_text_file
 
 
 class CreateFileTool(AgentToolDefine):
@@ -49,6 +47,8 @@ class CreateFileTool(AgentToolDefine):
         if not os.path.exists(dir_path):
             os.makedirs(dir_path)
 
+        # Write synchronously so an edit_file gathered in the same turn
+        # cannot observe the file before its content is in place
         with open(absolute_path, "w") as f:
             f.write(content)
         return AgentToolReturn(
@@ -1,5 +1,4 @@
 import os
-from ...constants import MAX_READ_FILE_LINES, MAX_LINE_CHAR_LENGTH
 from ..base import AgentToolDefine, AgentToolReturn
 from ...core.session import Session
 from ...utils.file import is_text_file
@@ -115,6 +114,9 @@ For example:
             # replacing
             lines = lines[: start_line - 1] + content.split("\n") + lines[end_line:]
             action = "REPLACE"
+        # Write synchronously: tool calls of one turn run under asyncio.gather,
+        # and yielding between the read and the write would let a concurrent
+        # edit of the same file read stale content and overwrite this one
         with open(absolute_path, "w") as f:
             f.write("\n".join(lines))
 
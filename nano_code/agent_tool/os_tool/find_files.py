@@ -1,10 +1,9 @@
 import os
+import stat
 import glob
 import time
-from ...constants import MAX_READ_FILE_LINES, MAX_LINE_CHAR_LENGTH
 from ..base import AgentToolDefine, AgentToolReturn
 from ...core.session import Session
-from ...utils.file import is_text_file
 
 
 class FindFilesTool(AgentToolDefine):
@@ -49,14 +48,14 @@ Ideal for quickly locating files based on their name or path structure, especial
                 f"Search path {search_path} is not within the working directory {session.working_dir}",
             )
 
-        # Check if the search path exists
-        if not os.path.exists(search_path):
+        # Check the search path exists and is a directory with a single stat
+        try:
+            search_path_stat = os.stat(search_path)
+        except OSError:
             return AgentToolReturn.error(
                 self.name, f"Search path {search_path} does not exist"
             )
-
-        # Check if the search path is a directory
-        if not os.path.isdir(search_path):
+        if not stat.S_ISDIR(search_path_stat.st_mode):
             return AgentToolReturn.error(
                 self.name, f"Search path {search_path} is not a directory"
             )
@@ -1,7 +1,21 @@
 import os
+import stat
+import time
 from ..base import AgentToolDefine, AgentToolReturn
 from ...core.session import Session
 
+PERMISSION_BITS = (
+    (0o400, "r"),
+    (0o200, "w"),
+    (0o100, "x"),
+    (0o040, "r"),
+    (0o020, "w"),
+    (0o010, "x"),
+    (0o004, "r"),
+    (0o002, "w"),
+    (0o001, "x"),
+)
+
 
 class ListDirTool(AgentToolDefine):
     @classmethod
@@ -44,12 +58,14 @@ Similar to the Unix 'ls' command.""",
                 f"Directory {absolute_path} is not within the working directory {session.working_dir}",
             )
 
-        if not os.path.exists(absolute_path):
+        try:
+            dir_stat = os.stat(absolute_path)
+        except OSError:
             return AgentToolReturn.error(
                 self.name, f"Directory {absolute_path} does not exist"
             )
 
-        if not os.path.isdir(absolute_path):
+        if not stat.S_ISDIR(dir_stat.st_mode):
             return AgentToolReturn.error(
                 self.name, f"Path {absolute_path} is not a directory"
             )
@@ -71,72 +87,57 @@ Similar to the Unix 'ls' command.""",
             abs_path = os.path.join(absolute_path, item)
             if session.ignore_path(abs_path):
                 continue
-            items.append(item)
+            # Stat each entry once, both sorting and formatting use the result
+            try:
+                stat_info = os.stat(abs_path)
+            except OSError:
+                stat_info = None
+            is_dir = stat_info is not None and stat.S_ISDIR(stat_info.st_mode)
+            items.append((item, stat_info, is_dir))
 
         # Sort items (directories first, then files, both alphabetically)
-        def sort_key(item):
-            item_path = os.path.join(absolute_path, item)
-            is_dir = os.path.isdir(item_path)
-            return (not is_dir, item.lower())  # False sorts before True, so dirs first
-
-        items.sort(key=sort_key)
+        # False sorts before True, so dirs first
+        items.sort(key=lambda x: (not x[2], x[0].lower()))
 
         # Build the output
         output_lines = []
         total_files = 0
         total_dirs = 0
 
-        for item in items:
-            item_path = os.path.join(absolute_path, item)
-
-            try:
-                stat_info = os.stat(item_path)
-                is_dir = os.path.isdir(item_path)
-
-                if is_dir:
-                    total_dirs += 1
-                    item_type = "[dir]"
-                else:
-                    total_files += 1
-                    item_type = "[file]"
-
-                # Format file size
-                size = stat_info.st_size
-                if size < 1024:
-                    size_str = f"{size}B"
-                elif size < 1024 * 1024:
-                    size_str = f"{size/1024:.1f}KB"
-                elif size < 1024 * 1024 * 1024:
-                    size_str = f"{size/(1024*1024):.1f}MB"
-                else:
-                    size_str = f"{size/(1024*1024*1024):.1f}GB"
-
-                # Format permissions
-                mode = stat_info.st_mode
-                permissions = ""
-                permissions += "r" if mode & 0o400 else "-"
-                permissions += "w" if mode & 0o200 else "-"
-                permissions += "x" if mode & 0o100 else "-"
-                permissions += "r" if mode & 0o040 else "-"
-                permissions += "w" if mode & 0o020 else "-"
-                permissions += "x" if mode & 0o010 else "-"
-                permissions += "r" if mode & 0o004 else "-"
-                permissions += "w" if mode & 0o002 else "-"
-                permissions += "x" if mode & 0o001 else "-"
-
-                # Format modification time
-                import time
-
-                mtime = time.strftime(
-                    "%Y-%m-%d %H:%M", time.localtime(stat_info.st_mtime)
-                )
-                output_lines.append(
-                    f"{item_type} {permissions} {size_str:>8} {mtime} {item}"
-                )
-
-            except (OSError, PermissionError):
+        for item, stat_info, is_dir in items:
+            if stat_info is None:
                 # If we can't stat the item, just show it without details
                 output_lines.append(f"[?]   {item} (stat failed)")
+                continue
+            if is_dir:
+                total_dirs += 1
+                item_type = "[dir]"
+            else:
+                total_files += 1
+                item_type = "[file]"
+
+            # Format file size
+            size = stat_info.st_size
+            if size < 1024:
+                size_str = f"{size}B"
+            elif size < 1024 * 1024:
+                size_str = f"{size/1024:.1f}KB"
+            elif size < 1024 * 1024 * 1024:
+                size_str = f"{size/(1024*1024):.1f}MB"
+            else:
+                size_str = f"{size/(1024*1024*1024):.1f}GB"
+
+            # Format permissions
+            mode = stat_info.st_mode
+            permissions = "".join(
+                c if mode & bit else "-" for bit, c in PERMISSION_BITS
+            )
+
+            # Format modification time
+            mtime = time.strftime("%Y-%m-%d %H:%M", time.localtime(stat_info.st_mtime))
+            output_lines.append(
+                f"{item_type} {permissions} {size_str:>8} {mtime} {item}"
+            )
 
         # Create summary
         if not items:
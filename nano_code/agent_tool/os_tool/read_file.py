@@ -1,8 +1,31 @@
 import os
-from ...constants import MAX_READ_FILE_LINES, MAX_LINE_CHAR_LENGTH
+import stat
+import asyncio
+from ...constants import MAX_READ_FILE_LINES
 from ..base import AgentToolDefine, AgentToolReturn
 from ...core.session import Session
-from ...utils.file import is_text_file
+from ...utils.file import is_text_file, truncate_line
+
+
+def read_line_window(path: str, start: int, end: int) -> tuple[list[str], int]:
+    """Stream the file and only keep lines in [start, end) in memory.
+
+    Returns the kept lines and the total number of lines in the file.
+    """
+    read_lines = []
+    total_lines = 0
+    line = ""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if start <= total_lines < end:
+                read_lines.append(line.rstrip("\n"))
+            total_lines += 1
+    # A trailing newline (or an empty file) leaves one last empty line
+    if line == "" or line.endswith("\n"):
+        if start <= total_lines < end:
+            read_lines.append("")
+        total_lines += 1
+    return read_lines, total_lines
 
 
 class ReadFileTool(AgentToolDefine):
@@ -53,11 +76,16 @@ For text files, it can read specific line ranges.""",
                 self.name,
                 f"File {absolute_path} is not within the working directory {session.working_dir}",
             )
-        if not os.path.exists(absolute_path):
+        # One stat covers both the existence and the regular-file checks.
+        # Non-regular files (directories, FIFOs, devices) are rejected before
+        # open(), which would block forever on a FIFO
+        try:
+            file_stat = os.stat(absolute_path)
+        except OSError:
             return AgentToolReturn.error(
                 self.name, f"File {absolute_path} does not exist"
             )
-        if not os.path.isfile(absolute_path):
+        if not stat.S_ISREG(file_stat.st_mode):
             return AgentToolReturn.error(
                 self.name, f"File {absolute_path} is not a file"
             )
@@ -69,29 +97,23 @@ For text files, it can read specific line ranges.""",
                 f"File {absolute_path} is not a text file, the type is {mime_type}",
             )
 
-        with open(absolute_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        lines = content.split("\n")
-        total_lines = len(lines)
-
         start_line_no = offset or 0
         end_line_no = min(
-            start_line_no + limit if limit else len(lines), MAX_READ_FILE_LINES
+            start_line_no + limit if limit else MAX_READ_FILE_LINES,
+            MAX_READ_FILE_LINES,
         )
 
-        actual_start_line_no = min(start_line_no, len(lines))
-        actual_end_line_no = max(min(end_line_no, len(lines)), actual_start_line_no)
-        read_lines = lines[actual_start_line_no:actual_end_line_no]
-        line_nos = [f"L{i+1}" for i in range(actual_start_line_no, actual_end_line_no)]
-        read_lines = [
-            (
-                l
-                if len(l) < MAX_LINE_CHAR_LENGTH
-                else l[:MAX_LINE_CHAR_LENGTH] + "... [truncated]"
-            )
-            for l in read_lines
-        ]
-        content = "\n".join([f"{i} {l}" for i, l in zip(line_nos, read_lines)])
+        # Keep the event loop free while reading from disk
+        read_lines, total_lines = await asyncio.to_thread(
+            read_line_window, absolute_path, start_line_no, end_line_no
+        )
+
+        actual_start_line_no = min(start_line_no, total_lines)
+        actual_end_line_no = max(min(end_line_no, total_lines), actual_start_line_no)
+        content = "\n".join(
+            f"L{i} {truncate_line(l)}"
+            for i, l in enumerate(read_lines, actual_start_line_no + 1)
+        )
         return AgentToolReturn(
             for_llm=f"""[Read File {absolute_path} with L{actual_start_line_no}-{actual_end_line_no}. #total lines {total_lines}. below is the file content with line annotations]
 {content}
@@ -1,12 +1,13 @@
 import os
+import stat
 import glob
 import re
 from typing import List, Optional
 from dataclasses import dataclass
-from ...constants import MAX_READ_FILE_LINES, MAX_LINE_CHAR_LENGTH
+from ...constants import MAX_READ_FILE_LINES
 from ..base import AgentToolDefine, AgentToolReturn
 from ...core.session import Session
-from ...utils.file import is_text_file
+from ...utils.file import is_text_file, truncate_line
 
 
 @dataclass
@@ -112,26 +113,12 @@ Can filter files by a glob pattern. Returns the lines containing matches, along
                                 GrepMatch(
                                     file_path=abs_file_path,
                                     line_number=line_num + 1,
-                                    line=(
-                                        line
-                                        if len(line) < MAX_LINE_CHAR_LENGTH
-                                        else line[:MAX_LINE_CHAR_LENGTH]
-                                        + "... [truncated]"
-                                    ),
+                                    line=truncate_line(line),
                                     section="\n".join(
-                                        [
-                                            f"L{line_i+1} "
-                                            + (
-                                                l
-                                                if len(l) < MAX_LINE_CHAR_LENGTH
-                                                else l[:MAX_LINE_CHAR_LENGTH]
-                                                + "... [truncated]"
-                                            )
-                                            for line_i, l in zip(
-                                                range(start_line, end_line),
-                                                lines[start_line:end_line],
-                                            )
-                                        ]
+                                        f"L{line_i+1} {truncate_line(l)}"
+                                        for line_i, l in enumerate(
+                                            lines[start_line:end_line], start_line
+                                        )
                                     ),
                                 )
                             )
@@ -160,14 +147,14 @@ Can filter files by a glob pattern. Returns the lines containing matches, along
                 f"Search path {search_path} is not within the working directory {session.working_dir}",
             )
 
-        # Check if the search path exists
-        if not os.path.exists(search_path):
+        # Check the search path exists and is a directory with a single stat
+        try:
+            search_path_stat = os.stat(search_path)
+        except OSError:
             return AgentToolReturn.error(
                 self.name, f"Search path {search_path} does not exist"
             )
-
-        # Check if the search path is a directory
-        if not os.path.isdir(search_path):
+        if not stat.S_ISDIR(search_path_stat.st_mode):
             return AgentToolReturn.error(
                 self.name, f"Search path {search_path} is not a directory"
             )
@@ -188,13 +175,6 @@ Can filter files by a glob pattern. Returns the lines containing matches, along
             for match in matches[
                 :max_matches
             ]:  # Limit to max_matches to avoid overwhelming output
-                # Truncate long lines
-                line_content = match.line
-                if len(line_content) > MAX_LINE_CHAR_LENGTH:
-                    line_content = (
-                        line_content[:MAX_LINE_CHAR_LENGTH] + "... [truncated]"
-                    )
-
                 output_lines.append(
                     f"{match.file_path}:L{match.line_number}\n{match.section}\n"
                 )
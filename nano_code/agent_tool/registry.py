@@ -3,11 +3,13 @@ from ..core.session import Session
 
 
 class ToolRegistry:
-    def __init__(self):
-        self.__tools: dict[str, AgentToolDefine] = {}
+    def __init__(self, *tools: AgentToolDefine):
+        self.__tools: dict[str, AgentToolDefine] = {tool.name: tool for tool in tools}
+        self.__schemas: list[dict] | None = None
 
     def register(self, tool: AgentToolDefine):
         self.__tools[tool.name] = tool
+        self.__schemas = None
 
     def add_tools(self, tools: list[AgentToolDefine]):
         for tool in tools:
@@ -17,7 +19,12 @@ class ToolRegistry:
         return list(self.__tools.values())
 
     def get_schemas(self):
-        return [tool.get_function_schema() for tool in self.__tools.values()]
+        # Schemas are requested on every LLM turn, build them once per tool set
+        if self.__schemas is None:
+            self.__schemas = [
+                tool.get_function_schema() for tool in self.__tools.values()
+            ]
+        return self.__schemas
 
     def list_tools(self):
         return list(self.__tools.keys())
@@ -9,3 +9,4 @@ MEMORY_FILE = "CODE.md"
 MAX_READ_FILE_LINES = 2000
 MAX_LINE_CHAR_LENGTH = 2000
 MAX_FOR_LLM_TOOL_RETURN_TOKENS = 1600
+MAX_IGNORE_PATH_CACHE_SIZE = 8192
@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from openai.types.chat import ChatCompletion
 
 
 @dataclass
@@ -1,16 +1,15 @@
 import os
 import uuid
-import glob
 import time
 import json
+import functools
 from hashlib import sha256
-from logging import Logger
 from dataclasses import dataclass, field
 from gitignore_parser import parse_gitignore
 from typing import Literal
-from ..constants import NANO_CODE_TEMP_DIR, MEMORY_FILE
+from ..constants import NANO_CODE_TEMP_DIR, MEMORY_FILE, MAX_IGNORE_PATH_CACHE_SIZE
 from ..utils.paths import upward_git_root
-from ..utils.logger import SessionLogger, AIConsoleLogger
+from ..utils.logger import SessionLogger
 from ..env import Env
 from .cost import (
     LLMCheckpoint,
@@ -56,21 +55,28 @@ class Session:
             os.chdir(self.working_dir)
 
         self.__project_root = upward_git_root(self.working_dir) or self.working_dir
+        self.__tempdir = os.path.join(
+            NANO_CODE_TEMP_DIR, sha256(self.__project_root.encode()).hexdigest()
+        )
         self.__ignore_matchers = self.find_ignore_matchers()
+        # Matchers are fixed for the session, so ignore results can be memoized.
+        # Bounded: search_text and find_files send every file in the tree here
+        self.__cached_match_ignore = functools.lru_cache(
+            maxsize=MAX_IGNORE_PATH_CACHE_SIZE
+        )(self.__match_ignore)
 
         self.log(f"Session Environment: {self.working_env}")
         self.log(f"Git project root: {self.__project_root}")
         self.log(f"Found {len(self.__ignore_matchers)} ignore matchers")
 
     def get_tempdir(self) -> str:
-        return os.path.join(
-            NANO_CODE_TEMP_DIR, sha256(self.__project_root.encode()).hexdigest()
-        )
+        return self.__tempdir
 
     def cleanup_checkpoint(self):
         try:
             os.rmdir(self.get_tempdir())
-        except Exception:
+        except OSError:
+            # Missing or non-empty temp dir, nothing to clean up
             pass
 
     def find_ignore_matchers(self) -> list:
@@ -92,15 +98,18 @@ class Session:
             if ".gitignore" in files:
                 ignore_files.append(os.path.join(root, ".gitignore"))
 
-            # Sort dirs to ensure consistent traversal order
-            dirs.sort()
+            # Sort dirs to ensure consistent traversal order, and never descend
+            # into .git: its object store can hold thousands of directories
+            dirs[:] = [d for d in sorted(dirs) if d != ".git"]
 
         # Parse gitignore rules if found
         ignore_matchers = {os.path.dirname(f): parse_gitignore(f) for f in ignore_files}
         return ignore_matchers
 
     def ignore_path(self, path: str) -> bool:
-        path = os.path.abspath(path)
+        return self.__cached_match_ignore(os.path.abspath(path))
+
+    def __match_ignore(self, path: str) -> bool:
         for k, v in self.__ignore_matchers.items():
             try:
                 # Check if path is actually within the directory k
@@ -138,7 +147,9 @@ class Session:
             # Filter out ignored subdirectories to avoid walking into them
             # (This modifies dirs in-place to affect os.walk's traversal)
             dirs[:] = [
-                d for d in sorted(dirs) if not self.ignore_path(os.path.join(root, d))
+                d
+                for d in sorted(dirs)
+                if d != ".git" and not self.ignore_path(os.path.join(root, d))
             ]
 
         # Filter out ignored memory files
@@ -193,16 +204,15 @@ class Session:
             os.makedirs(use_dir)
         file_name = f"{time.strftime('%Y_%m_%d_%H_%M_%S')}-{self.session_id}.json"
         file_path = os.path.join(use_dir, file_name)
+        # Serialize first and write once: json.dump issues a write per chunk
+        data = json.dumps(
+            {
+                "llm_checkpoints": [c.to_json() for c in self.running_llm_checkpoints],
+                "tool_checkpoints": [
+                    c.to_json() for c in self.running_tool_checkpoints
+                ],
+            },
+            ensure_ascii=False,
+        )
         with open(file_path, "w") as f:
-            json.dump(
-                {
-                    "llm_checkpoints": [
-                        c.to_json() for c in self.running_llm_checkpoints
-                    ],
-                    "tool_checkpoints": [
-                        c.to_json() for c in self.running_tool_checkpoints
-                    ],
-                },
-                f,
-                ensure_ascii=False,
-            )
+            f.write(data)
@@ -3,7 +3,6 @@ import logging
 import dataclasses
 import json
 from dataclasses import dataclass
-from .utils.logger import SessionLogger
 from .constants import NANO_CODE_DIR
 
 
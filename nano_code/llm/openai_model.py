@@ -16,9 +16,13 @@ async def openai_complete(
 
     openai_async_client = get_openai_async_client_instance(session)
     if system_prompt:
-        messages.insert(0, {"role": "system", "content": system_prompt})
+        # Build a new list rather than insert(0, ...) so the caller's message
+        # history is not mutated, otherwise every turn would add another
+        # system prompt to it
+        messages = [{"role": "system", "content": system_prompt}, *messages]
 
-    _start = asyncio.get_event_loop().time()
+    loop = asyncio.get_running_loop()
+    _start = loop.time()
     response: ChatCompletion = await openai_async_client.chat.completions.create(
         model=model,
         messages=messages,
@@ -26,7 +30,7 @@ async def openai_complete(
         tools=tools,
         **kwargs,
     )
-    _finish = asyncio.get_event_loop().time()
+    _finish = loop.time()
 
     session.update_llm_checkpoint(
         LLMCheckpoint(
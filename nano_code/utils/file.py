@@ -1,7 +1,7 @@
 import os
+import functools
 import mimetypes
-
-mimetypes.init()
+from ..constants import MAX_LINE_CHAR_LENGTH
 
 TEXT_EXT = {
     ".md",
@@ -40,12 +40,27 @@ SPECIAL_FILE_NAME = {
     ".env.local",
     ".env.development",
 }
+# Text file patterns
+TEXT_MIME_TYPES = (
+    "text/",
+    "application/json",
+    "application/xml",
+    "application/javascript",
+    "application/x-sh",
+    "application/x-python",
+)
 
 
 def mime_file_type(file_path: str) -> str:
     return mimetypes.guess_type(file_path, strict=False)[0]
 
 
+@functools.lru_cache(maxsize=1024)
+def mime_ext_type(ext: str) -> str | None:
+    # guess_type only looks at the extension, so cache it per unique extension
+    return mime_file_type(f"file{ext}")
+
+
 def get_file_extname(file_path: str):
     return os.path.splitext(file_path)[1]
 
@@ -59,33 +74,31 @@ def is_text_file(file_path: str) -> tuple[bool, str | None]:
     Use python-magic to determine if a file is text-based
     Returns: (is_text, label/mime_type/extension)
     """
-    # Get MIME type
-    ext = get_file_extname(file_path)
+    # Split the path once here instead of going through the helper wrappers
+    ext = os.path.splitext(file_path)[1]
     if ext in TEXT_EXT:
         return True, ext
+    # Special names have no MIME type of their own, check them before any lookup
+    file_name = os.path.basename(file_path)
+    if file_name in SPECIAL_FILE_NAME:
+        return True, file_name
 
-    mime_type = mime_file_type(file_path)
+    mime_type = mime_ext_type(ext)
     if mime_type is None:
-        file_name = get_filename(file_path)
-        if file_name in SPECIAL_FILE_NAME:
-            return True, file_name
         # No mime and no special file, return False, None
         return False, None
-    # Text file patterns
-    text_mime_types = [
-        "text/",
-        "application/json",
-        "application/xml",
-        "application/javascript",
-        "application/x-sh",
-        "application/x-python",
-    ]
-
-    is_text = any(mime_type.startswith(pattern) for pattern in text_mime_types)
+    # str.startswith takes the whole prefix tuple in a single call
+    is_text = mime_type.startswith(TEXT_MIME_TYPES)
 
     return is_text, mime_type
 
 
+def truncate_line(line: str) -> str:
+    if len(line) < MAX_LINE_CHAR_LENGTH:
+        return line
+    return line[:MAX_LINE_CHAR_LENGTH] + "... [truncated]"
+
+
 if __name__ == "__main__":
     print(
         is_text_file(
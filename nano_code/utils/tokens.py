@@ -1,18 +1,24 @@
+import functools
 import tiktoken
 from openai.types.chat import ChatCompletionMessage
 
-TOKENIZER = tiktoken.encoding_for_model("gpt-4")
+
+@functools.cache
+def get_tokenizer() -> tiktoken.Encoding:
+    # Loaded on first use: building the encoding reads (and may download) the BPE file
+    return tiktoken.encoding_for_model("gpt-4")
 
 
 def count_tokens(text: str) -> int:
-    return len(TOKENIZER.encode(text))
+    return len(get_tokenizer().encode(text))
 
 
 def truncate_text(text: str, max_tokens: int) -> str:
-    tokens = TOKENIZER.encode(text)
+    tokenizer = get_tokenizer()
+    tokens = tokenizer.encode(text)
     if len(tokens) <= max_tokens:
         return text
-    return TOKENIZER.decode(tokens[:max_tokens]) + " ...[truncated]"
+    return tokenizer.decode(tokens[:max_tokens]) + " ...[truncated]"
 
 
 def count_message(message: dict | ChatCompletionMessage) -> int:
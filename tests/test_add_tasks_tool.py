@@ -17,7 +17,7 @@ class DummySession:
         return "/"
 
 def run_async(func, *args, **kwargs):
-    return asyncio.get_event_loop().run_until_complete(func(*args, **kwargs))
+    return asyncio.run(func(*args, **kwargs))
 
 @pytest.fixture(autouse=True)
 def clear_todos():
@@ -7,7 +7,10 @@ from nano_code.core.session import Session
 import os
 import asyncio
 import tempfile
+import time
+from unittest import mock
 from nano_code.agent_tool.os_tool.edit_file import EditFileTool
+from nano_code.agent_tool.os_tool.create_file import CreateFileTool
 from nano_code.core.session import Session
 import pytest
 
@@ -112,3 +115,65 @@ async def test_edit_file_tool_edge_cases():
     assert lines == []
 
     os.remove(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_edit_file_tool_concurrent_edits_same_file(tmp_path):
+    # Tool calls of one turn are run together with asyncio.gather
+    file_path = tmp_path / "concurrent.txt"
+    file_path.write_text("l1\nl2\nl3\nl4")
+    session = Session(working_dir=str(tmp_path))
+    tool = EditFileTool.init()
+
+    def slow_open(path, mode="r", *args, **kwargs):
+        # Widen the window between reading and writing the file
+        if "w" in mode:
+            time.sleep(0.05)
+        return open(path, mode, *args, **kwargs)
+
+    with mock.patch(
+        "nano_code.agent_tool.os_tool.edit_file.open", slow_open, create=True
+    ):
+        await asyncio.gather(
+            tool.execute(
+                session,
+                {
+                    "file_path": str(file_path),
+                    "content": "A",
+                    "start_line": 1,
+                    "end_line": 1,
+                },
+            ),
+            tool.execute(
+                session,
+                {
+                    "file_path": str(file_path),
+                    "content": "D",
+                    "start_line": 4,
+                    "end_line": 4,
+                },
+            ),
+        )
+    assert file_path.read_text() == "A\nl2\nl3\nD"
+
+
+@pytest.mark.asyncio
+async def test_create_then_edit_same_file_concurrently(tmp_path):
+    file_path = tmp_path / "new.txt"
+    session = Session(working_dir=str(tmp_path))
+
+    await asyncio.gather(
+        CreateFileTool.init().execute(
+            session, {"file_path": str(file_path), "content": "a\nb"}
+        ),
+        EditFileTool.init().execute(
+            session,
+            {
+                "file_path": str(file_path),
+                "content": "B",
+                "start_line": 2,
+                "end_line": 2,
+            },
+        ),
+    )
+    assert file_path.read_text() == "a\nB"
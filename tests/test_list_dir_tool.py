@@ -1,4 +1,5 @@
 import pytest
+import asyncio
 import tempfile
 import os
 import stat
@@ -9,6 +10,9 @@ from nano_code.agent_tool.os_tool.list_dir import ListDirTool
 from nano_code.core.session import Session
 
 
+TOOL = ListDirTool.init()
+
+
 def build_session(tmp_path):
     sess = Session(working_dir=str(tmp_path))
     sess.working_dir = str(tmp_path)
@@ -16,10 +20,7 @@ def build_session(tmp_path):
 
 
 def run_tool(session, **kwargs):
-    tool = ListDirTool.init()
-    import asyncio
-
-    return asyncio.get_event_loop().run_until_complete(tool._execute(session, kwargs))
+    return asyncio.run(TOOL._execute(session, kwargs))
 
 
 def test_list_normal(tmp_path):
@@ -75,3 +76,26 @@ def test_path_not_within_root(tmp_path):
     session = build_session(tmp_path)
     result = run_tool(session, absolute_path="/")
     assert "not within the working directory" in result.for_llm.lower()
+
+
+def test_dirs_first_and_stat_once(tmp_path):
+    (tmp_path / "b_dir").mkdir()
+    (tmp_path / "a.txt").write_text("abc")
+    (tmp_path / "broken").symlink_to(tmp_path / "missing")
+    session = build_session(tmp_path)
+    real_stat = os.stat
+    stat_calls = []
+
+    def counting_stat(path, *args, **kwargs):
+        stat_calls.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    with mock.patch("os.stat", side_effect=counting_stat):
+        result = run_tool(session, absolute_path=str(tmp_path))
+    lines = result.for_llm.splitlines()[1:4]
+    assert lines[0].startswith("[dir]") and lines[0].endswith("b_dir")
+    assert lines[1].startswith("[file]") and lines[1].endswith("a.txt")
+    assert lines[2] == "[?]   broken (stat failed)"
+    assert "Total: 1 directories, 1 files" in result.for_llm
+    for name in ("b_dir", "a.txt", "broken"):
+        assert stat_calls.count(str(tmp_path / name)) == 1
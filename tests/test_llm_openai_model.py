@@ -0,0 +1,38 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+from nano_code.llm.openai_model import openai_complete
+
+
+def make_mock_response():
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].model_dump.return_value = {"message": {"content": "hi"}}
+    response.usage.prompt_tokens = 3
+    response.usage.completion_tokens = 2
+    response.usage.total_tokens = 5
+    return response
+
+
+def test_openai_complete_keeps_caller_messages():
+    client = Mock()
+    client.chat.completions.create = AsyncMock(return_value=make_mock_response())
+    session = Mock()
+    messages = [{"role": "user", "content": "hello"}]
+
+    with patch(
+        "nano_code.llm.openai_model.get_openai_async_client_instance",
+        return_value=client,
+    ):
+        # Two turns on the same history, as agent_loop does
+        for _ in range(2):
+            asyncio.run(
+                openai_complete(session, "model", messages, system_prompt="sys")
+            )
+
+    assert messages == [{"role": "user", "content": "hello"}]
+    sent = client.chat.completions.create.call_args.kwargs["messages"]
+    assert sent == [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": "hello"},
+    ]
+    assert [m["role"] for m in sent].count("system") == 1
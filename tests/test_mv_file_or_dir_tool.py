@@ -6,6 +6,8 @@ from unittest.mock import Mock
 from nano_code.agent_tool.os_tool.mv_file_or_dir import MoveFileOrDirTool
 from nano_code.agent_tool.base import AgentToolReturn
 
+TOOL = MoveFileOrDirTool.init()
+
 def make_mock_session(working_dir):
     session = Mock()
     session.working_dir = working_dir
@@ -18,8 +20,7 @@ def test_mv_file_success(tmp_path):
     src_file.write_text("move me!")
     session = make_mock_session(str(tmp_path))
     args = {"from_path": str(src_file), "to_path": str(dst_file)}
-    tool = MoveFileOrDirTool.init()
-    result = asyncio.run(tool._execute(session, args))
+    result = asyncio.run(TOOL._execute(session, args))
     assert isinstance(result, AgentToolReturn)
     assert "successfully" in result.for_llm
     assert not src_file.exists() and dst_file.exists()
@@ -30,8 +31,7 @@ def test_mv_missing_source(tmp_path):
     dst_file = tmp_path / "dest.txt"
     session = make_mock_session(str(tmp_path))
     args = {"from_path": str(src_file), "to_path": str(dst_file)}
-    tool = MoveFileOrDirTool.init()
-    result = asyncio.run(tool._execute(session, args))
+    result = asyncio.run(TOOL._execute(session, args))
     assert "does not exist" in result.for_llm or "does not exist" in result.for_human
 
 def test_mv_destination_exists(tmp_path):
@@ -41,8 +41,7 @@ def test_mv_destination_exists(tmp_path):
     dst_file.write_text("should block")
     session = make_mock_session(str(tmp_path))
     args = {"from_path": str(src_file), "to_path": str(dst_file)}
-    tool = MoveFileOrDirTool.init()
-    result = asyncio.run(tool._execute(session, args))
+    result = asyncio.run(TOOL._execute(session, args))
     assert "already exists" in result.for_llm or "already exists" in result.for_human
 
 def test_mv_directory_success(tmp_path):
@@ -52,8 +51,7 @@ def test_mv_directory_success(tmp_path):
     dst_dir = tmp_path / "targetdir"
     session = make_mock_session(str(tmp_path))
     args = {"from_path": str(src_dir), "to_path": str(dst_dir)}
-    tool = MoveFileOrDirTool.init()
-    result = asyncio.run(tool._execute(session, args))
+    result = asyncio.run(TOOL._execute(session, args))
     assert isinstance(result, AgentToolReturn)
     assert "successfully" in result.for_llm
     assert not src_dir.exists() and dst_dir.exists()
@@ -49,3 +49,91 @@ def test_read_file_not_exist(tmp_path):
         assert (
             "does not exist" in result.for_llm or "does not exist" in result.for_human
         )
+
+
+# Helper: write raw bytes and read them back through the tool
+def read_raw(tmp_path, data: bytes, **kwargs):
+    file_path = tmp_path / "raw.txt"
+    file_path.write_bytes(data)
+    session = make_mock_session(str(tmp_path))
+    args = {"absolute_path": str(file_path), **kwargs}
+    return asyncio.run(ReadFileTool.init()._execute(session, args))
+
+
+# Empty file counts as a single empty line
+def test_read_file_empty(tmp_path):
+    result = read_raw(tmp_path, b"")
+    assert "#total lines 1." in result.for_llm
+    assert result.for_llm.endswith("\nL1 \n")
+
+
+# Trailing newline leaves one last empty line
+def test_read_file_trailing_newline(tmp_path):
+    result = read_raw(tmp_path, b"a\nb\n")
+    assert "#total lines 3." in result.for_llm
+    assert "L0-3" in result.for_llm
+    assert result.for_llm.endswith("\nL1 a\nL2 b\nL3 \n")
+
+
+def test_read_file_no_trailing_newline(tmp_path):
+    result = read_raw(tmp_path, b"a\nb")
+    assert "#total lines 2." in result.for_llm
+    assert result.for_llm.endswith("\nL1 a\nL2 b\n")
+
+
+# \r\n is read as a plain line break
+def test_read_file_crlf(tmp_path):
+    result = read_raw(tmp_path, b"a\r\nb\r\n")
+    assert "#total lines 3." in result.for_llm
+    assert result.for_llm.endswith("\nL1 a\nL2 b\nL3 \n")
+    assert "\r" not in result.for_llm
+
+
+# Offset past EOF returns an empty window clamped to the file length
+def test_read_file_offset_past_eof(tmp_path):
+    result = read_raw(tmp_path, b"a\nb", offset=10, limit=5)
+    assert "L2-2. #total lines 2." in result.for_llm
+    assert "L1 a" not in result.for_llm
+
+
+# Total line count is reported even when only a window is read
+def test_read_file_total_lines_with_window(tmp_path):
+    data = "\n".join(str(i) for i in range(10)).encode()
+    result = read_raw(tmp_path, data, offset=2, limit=3)
+    assert "L2-5. #total lines 10." in result.for_llm
+    assert result.for_llm.endswith("\nL3 2\nL4 3\nL5 4\n")
+
+
+# Directories are reported as not a file, with or without a text-like name
+def test_read_file_directory(tmp_path):
+    session = make_mock_session(str(tmp_path))
+    tool = ReadFileTool.init()
+    for name in ("src", "pkg.py"):
+        dir_path = tmp_path / name
+        dir_path.mkdir()
+        result = asyncio.run(tool._execute(session, {"absolute_path": str(dir_path)}))
+        assert "is not a file" in result.for_llm
+
+
+# Missing paths are reported as missing whatever their name looks like
+def test_read_file_missing_non_text_names(tmp_path):
+    session = make_mock_session(str(tmp_path))
+    tool = ReadFileTool.init()
+    for name in ("missing", "x.png"):
+        args = {"absolute_path": str(tmp_path / name)}
+        result = asyncio.run(tool._execute(session, args))
+        assert "does not exist" in result.for_llm
+
+
+# A FIFO is rejected up front instead of blocking in open()
+def test_read_file_fifo(tmp_path):
+    fifo_path = tmp_path / "pipe.txt"
+    os.mkfifo(fifo_path)
+    session = make_mock_session(str(tmp_path))
+    tool = ReadFileTool.init()
+    result = asyncio.run(
+        asyncio.wait_for(
+            tool._execute(session, {"absolute_path": str(fifo_path)}), timeout=5
+        )
+    )
+    assert "is not a file" in result.for_llm
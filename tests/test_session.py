@@ -0,0 +1,87 @@
+import os
+from unittest.mock import Mock
+from nano_code.constants import MEMORY_FILE
+import nano_code.core.session as session_module
+from nano_code.core.session import Session
+
+
+def build_repo(tmp_path):
+    # A git project with rules at the root, under .github/ and inside .git/
+    (tmp_path / ".git" / "info").mkdir(parents=True)
+    (tmp_path / ".git" / ".gitignore").write_text("*\n")
+    (tmp_path / ".git" / "info" / MEMORY_FILE).write_text("git internals")
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / ".github").mkdir()
+    (tmp_path / ".github" / ".gitignore").write_text("*.tmp\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / MEMORY_FILE).write_text("src memory")
+    (tmp_path / "build").mkdir()
+    return tmp_path
+
+
+def build_session(tmp_path):
+    return Session(working_dir=str(tmp_path), working_env=Mock())
+
+
+def count_matcher_calls(monkeypatch):
+    # Record every path passed to the parsed gitignore matchers
+    calls = []
+    parse_gitignore = session_module.parse_gitignore
+
+    def counting_parse(path):
+        matcher = parse_gitignore(path)
+
+        def match(p):
+            calls.append(p)
+            return matcher(p)
+
+        return match
+
+    monkeypatch.setattr(session_module, "parse_gitignore", counting_parse)
+    return calls
+
+
+def test_walks_skip_git_dir(tmp_path):
+    repo = build_repo(tmp_path)
+    session = build_session(repo)
+
+    ignore_dirs = set(session.find_ignore_matchers())
+    assert ignore_dirs == {str(repo), str(repo / ".github")}
+
+    memory_paths = session.find_memory_paths()
+    assert memory_paths == [str(repo / "src" / MEMORY_FILE)]
+
+
+def test_ignore_path_memoized(tmp_path, monkeypatch):
+    repo = build_repo(tmp_path)
+    calls = count_matcher_calls(monkeypatch)
+    session = build_session(repo)
+
+    build_dir = str(repo / "build")
+    assert session.ignore_path(build_dir)
+    matched = len(calls)
+    assert matched > 0
+    # Repeated and relative lookups hit the memo, not the matchers
+    assert session.ignore_path(build_dir)
+    assert session.ignore_path(os.path.relpath(build_dir))
+    assert len(calls) == matched
+
+    assert not session.ignore_path(str(repo / "src"))
+    assert not session.ignore_path(str(repo / "src"))
+    assert session.ignore_path(str(repo / ".github" / "a.tmp"))
+
+
+def test_ignore_path_memo_is_bounded(tmp_path, monkeypatch):
+    repo = build_repo(tmp_path)
+    calls = count_matcher_calls(monkeypatch)
+    monkeypatch.setattr(session_module, "MAX_IGNORE_PATH_CACHE_SIZE", 1)
+    session = build_session(repo)
+
+    build_dir = str(repo / "build")
+    session.ignore_path(build_dir)
+    matched = len(calls)
+    # A second path evicts the first, which is then matched again
+    session.ignore_path(str(repo / "src"))
+    calls.clear()
+    assert session.ignore_path(build_dir)
+    assert len(calls) == matched
@@ -4,3 +4,35 @@ import pytest
 
 def test_import_tools_module():
     import nano_code.agent_tool.tools  # should import without error
+
+
+def test_registries_built_from_constructor():
+    from nano_code.agent_tool.tools import OS_TOOLS, UTIL_TOOLS
+
+    assert OS_TOOLS.list_tools() == [
+        "list_dir",
+        "read_file",
+        "create_file",
+        "edit_file",
+        "mv_file_or_dir",
+        "find_files",
+        "search_text",
+    ]
+    assert UTIL_TOOLS.list_tools() == ["add_tasks"]
+
+
+def test_registry_schemas_cached_until_register():
+    from nano_code.agent_tool.registry import ToolRegistry
+    from nano_code.agent_tool.os_tool.list_dir import ListDirTool
+    from nano_code.agent_tool.os_tool.read_file import ReadFileTool
+
+    registry = ToolRegistry(ListDirTool.init())
+    schemas = registry.get_schemas()
+    assert registry.get_schemas() is schemas
+    assert [s["function"]["name"] for s in schemas] == ["list_dir"]
+
+    registry.register(ReadFileTool.init())
+    assert [s["function"]["name"] for s in registry.get_schemas()] == [
+        "list_dir",
+        "read_file",
+    ]
@@ -39,4 +39,23 @@ def test_is_text_file_special():
     for name in file_utils.SPECIAL_FILE_NAME:
         is_text, label = file_utils.is_text_file(name)
         assert is_text
-        assert label == name
\ No newline at end of file
+        assert label == name
+
+def test_is_text_file_by_mime_cached_per_ext():
+    file_utils.mime_ext_type.cache_clear()
+    assert file_utils.is_text_file("/a/run.sh")[0]
+    assert file_utils.is_text_file("/b/other.sh")[0]
+    assert file_utils.mime_ext_type.cache_info().hits == 1
+    is_text, _ = file_utils.is_text_file("/a/image.png")
+    assert not is_text
+
+def test_truncate_line():
+    from nano_code.constants import MAX_LINE_CHAR_LENGTH
+
+    short = "a" * (MAX_LINE_CHAR_LENGTH - 1)
+    assert file_utils.truncate_line(short) == short
+    long = "b" * (MAX_LINE_CHAR_LENGTH + 5)
+    assert (
+        file_utils.truncate_line(long)
+        == "b" * MAX_LINE_CHAR_LENGTH + "... [truncated]"
+    )